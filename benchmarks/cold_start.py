@@ -0,0 +1,67 @@
+"""Cold start benchmark.
+
+Spawns fresh interpreters and measures the time to import `main`, the time spent in
+the lifespan startup, and the time for the first login plus authenticated `GET /items`, for each NTHCART_STARTUP mode.
+
+Usage: python benchmarks/cold_start.py [--runs N]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MODES = ("lazy", "lifespan", "import")
+
+# Runs inside the child process. NTHCART_DATA points it at a copy of data.json so the repo file is untouched.
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+t2 = time.perf_counter()
+with TestClient(main.app) as client:
+    t3 = time.perf_counter()
+    resp = client.post("/login", json={"email": "alex@quicktest.com", "password": "11111111"})
+    resp = client.get("/items", headers={"X-Token": resp.headers["x-token"]})
+    assert resp.status_code == 200
+    t4 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "startup_ms": (t3 - t2) * 1000, "first_response_ms": (t4 - t3) * 1000}))
+"""
+
+
+def run_once(mode: str, data_path: Path) -> dict:
+    env = dict(os.environ, NTHCART_STARTUP=mode, NTHCART_DATA=str(data_path))
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, str(REPO_ROOT)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "data.json"
+        shutil.copyfile(REPO_ROOT / "data.json", data_path)
+
+        run_once("lazy", data_path) # populate __pycache__ so every mode starts equal
+        print(f"{'mode':<10} {'import ms':>10} {'startup ms':>11} {'first response ms':>18}")
+        for mode in MODES:
+            runs = [run_once(mode, data_path) for _ in range(args.runs)]
+            imp, startup, first = (statistics.median(r[k] for r in runs) for k in ("import_ms", "startup_ms", "first_response_ms"))
+            print(f"{mode:<10} {imp:>10.1f} {startup:>11.1f} {first:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,29 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from handlers import router as handlers_router
+import utils
 
-app = FastAPI()
+# NTHCART_STARTUP controls when startup costs are paid:
+#   "lifespan" (default) warms up in the FastAPI lifespan hook,
+#   "import" warms up at import time for runtimes that skip lifespan events,
+#   "lazy" does nothing and lets the first request pay for it.
+STARTUP_MODES = ("lifespan", "import", "lazy")
+STARTUP_MODE = os.environ.get("NTHCART_STARTUP", "lifespan")
+if STARTUP_MODE not in STARTUP_MODES:
+    raise ValueError(f"NTHCART_STARTUP must be one of {', '.join(STARTUP_MODES)}, got {STARTUP_MODE!r}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if STARTUP_MODE == "lifespan":
+        utils.warm_up()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(handlers_router) # Loading handlers and routes
 
+if STARTUP_MODE == "import":
+    utils.warm_up()
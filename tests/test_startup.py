@@ -0,0 +1,89 @@
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+import pytest
+from fastapi.testclient import TestClient
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+from main import app
+import utils
+
+
+@pytest.fixture(autouse=True)
+def reset_data(tmp_path, monkeypatch):
+    src = repo_root / "data.json"
+    dst = tmp_path / "data.json"
+    dst.write_bytes(src.read_bytes())
+    monkeypatch.setattr(utils, 'DATA_PATH', dst)
+    yield
+
+
+def test_preload_parses_and_validates_data():
+    assert utils.preload_data() == json.loads(utils.DATA_PATH.read_text())
+
+
+def test_preload_rejects_invalid_data():
+    utils.DATA_PATH.write_text(json.dumps({"items": []}))
+    with pytest.raises(ValueError):
+        utils.preload_data()
+
+
+def test_preload_rejects_item_without_price():
+    data = json.loads(utils.DATA_PATH.read_text())
+    del data["items"][0]["price"]
+    utils.DATA_PATH.write_text(json.dumps(data))
+    with pytest.raises(ValueError):
+        utils.preload_data()
+
+
+def test_lifespan_warm_up_serves_requests():
+    # lifespan mode (the default) warms up when the client starts, before any request
+    with TestClient(app) as client:
+        resp = client.post("/login", json={"email": "alex@quicktest.com", "password": "11111111"})
+        assert resp.status_code == 200
+        resp = client.get("/items", headers={"X-Token": resp.headers["x-token"]})
+        assert resp.status_code == 200
+        assert resp.json() == json.loads(utils.DATA_PATH.read_text())["items"]
+
+
+def _run_child(mode):
+    # Fresh interpreter so main.py runs its import time logic under the given mode.
+    # Prints whether PyJWT (only imported by warm_up) is loaded after import and after startup.
+    code = (
+        "import sys, main; from fastapi.testclient import TestClient; "
+        "imported = 'jwt' in sys.modules\n"
+        "with TestClient(main.app):\n"
+        "    started = 'jwt' in sys.modules\n"
+        "print(imported, started)"
+    )
+    env = dict(os.environ, NTHCART_STARTUP=mode, NTHCART_DATA=str(utils.DATA_PATH))
+    return subprocess.run([sys.executable, "-c", code], cwd=repo_root, env=env, capture_output=True, text=True)
+
+
+def test_startup_mode_import_warms_up_on_import():
+    assert _run_child("import").stdout.split() == ["True", "True"]
+
+
+def test_startup_mode_lifespan_warms_up_on_startup():
+    assert _run_child("lifespan").stdout.split() == ["False", "True"]
+
+
+def test_startup_mode_lazy_skips_warm_up():
+    assert _run_child("lazy").stdout.split() == ["False", "False"]
+
+
+def test_startup_mode_unknown_value_fails():
+    result = _run_child("Import")
+    assert result.returncode != 0
+    assert "NTHCART_STARTUP" in result.stderr
+
+
+def test_startup_mode_import_fails_fast_on_invalid_data():
+    utils.DATA_PATH.write_text(json.dumps({"items": []}))
+    result = _run_child("import")
+    assert result.returncode != 0
+    assert "ValueError" in result.stderr
@@ -2,16 +2,35 @@ import json
 from pathlib import Path
 from fastapi import HTTPException
 from typing import Optional
-import jwt
 import datetime
 import os
 
-DATA_PATH = Path(__file__).parent / "data.json"
+DATA_PATH = Path(os.environ.get("NTHCART_DATA", Path(__file__).parent / "data.json"))
+REQUIRED_KEYS = {"config": dict, "items": list, "users": dict}
 JWT_SECRET = os.environ.get("JWT_SECRET", "Ananthaprakash") # TO DO: use .env to set JWT_SECRET
 JWT_ALGO = "HS256"
 JWT_EXP_DELTA_SECONDS = 60 * 60 * 24 # 1 day
 
 
+def _jwt():
+    # PyJWT is deferred to keep cold start imports small, warm_up() pulls it in early
+    import jwt
+    return jwt
+
+
+def validate_data(data) -> dict:
+    """Check the top level shape of the store. Raises ValueError when it is malformed."""
+    if not isinstance(data, dict):
+        raise ValueError("data must be a JSON object")
+    for key, kind in REQUIRED_KEYS.items():
+        if not isinstance(data.get(key), kind):
+            raise ValueError(f"data.{key} must be a {kind.__name__}")
+    for item in data["items"]:
+        if not isinstance(item, dict) or "id" not in item or "price" not in item:
+            raise ValueError("every item needs an id and a price")
+    return data
+
+
 def load_data(): # Reason behind "on the fly" data loading is inspired from relational databases. Keep the connection only when necessary
     with DATA_PATH.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -22,6 +41,17 @@ def save_data(data):
         json.dump(data, f, indent=2)
 
 
+def preload_data() -> dict:
+    """Parse and validate data.json once at startup so a broken store fails fast."""
+    return validate_data(load_data())
+
+
+def warm_up() -> None:
+    """Pay the one-off startup costs before the first request: preload data and import PyJWT."""
+    preload_data()
+    _jwt()
+
+
 def authenticate(email: str, password: str) -> Optional[dict]:
     data = load_data()
     users = data.get("users", {})
@@ -34,6 +64,7 @@ def authenticate(email: str, password: str) -> Optional[dict]:
 
 
 def create_token_for_user(user: dict) -> str:
+    jwt = _jwt()
     now = datetime.datetime.now(datetime.timezone.utc)
     payload = {
         "sub": user.get("username"),
@@ -44,6 +75,7 @@ def create_token_for_user(user: dict) -> str:
 
 
 def decode_token(token: Optional[str]) -> dict:
+    jwt = _jwt()
     if not token:
         raise HTTPException(status_code=401, detail="missing token")
     try: